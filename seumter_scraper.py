@@ -4,6 +4,13 @@ import datetime
 import json
 import sys
 import io
+import mimetypes
+import mmap
+import queue
+import random
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -12,7 +19,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, SessionNotCreatedException
+from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
+from watchdog.events import FileSystemEventHandler
 
 # Windows 환경에서 한글 출력 오류 해결 (cp1252 -> utf-8)
 sys.stdout = io.TextIOWrapper(sys.stdout.detach(), encoding='utf-8')
@@ -31,31 +41,349 @@ EXCEL_FILENAME = "압구정동 주소.xlsx"
 EXCEL_PATH = os.path.join(BASE_DIR, EXCEL_FILENAME)
 DOWNLOAD_DIR = os.path.join(BASE_DIR, "downloads")
 PROCESSED_LOG_FILE = os.path.join(BASE_DIR, "processed.txt")
+CHROME_PROFILE_DIR = os.path.join(BASE_DIR, ".chrome-profile")  # CI 실행 간 로그인 세션 유지용
 TARGET_URL = "https://www.eais.go.kr/"
+CHROMEDRIVER_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "seumter", "chromedriver")
 CHUNK_SIZE = 50 
+SCRAPER_WORKERS = int(os.environ.get("SCRAPER_WORKERS", "1"))  # 동시에 실행할 브라우저 수
+WAIT_TIMEOUT = 10               # 요소 대기 최대 시간 (초)
+PAGE_LOAD_TIMEOUT = 15          # 페이지 로딩 최대 시간 (초)
+MIN_ADDRESS_INTERVAL = 1.0      # 주소 간 최소 간격, 서버 부하 방지 (초)
+FAILURE_BACKOFF_BASE = 2        # 연속 실패 시 대기 시간 시작값 (초)
+FAILURE_BACKOFF_MAX = 60        # 연속 실패 시 최대 대기 시간 (초)
+SCREENSHOT_TIMEOUT = 5          # 오류 스크린샷 저장 최대 대기 시간 (초)
+SHORT_WAIT_TIMEOUT = 5          # 저장된 로그인 세션 확인 대기 최대 시간 (초)
+# 화면 갱신 대기 최대 시간 (초). 선택자가 실제 화면과 맞지 않아도 기존 고정 대기보다 느려지지 않도록 같은 값 사용
+SUGGESTION_WAIT_TIMEOUT = 1     # 자동완성 목록
+RESULT_WAIT_TIMEOUT = 3         # 검색 결과 그리드
+TAB_CONTENT_WAIT_TIMEOUT = 2    # 전유부 탭 내용
+POLL_FREQUENCY = 0.2            # 요소 상태 확인 간격 (초)
+DOWNLOAD_TIMEOUT = 30           # 다운로드 완료 대기 최대 시간 (초)
+DOWNLOAD_POLL_INTERVAL = 0.25   # 다운로드 폴더 확인 간격 (폴링 감시 모드, 초)
+DOWNLOAD_SETTLE_TIME = 1        # 첫 파일 이후 추가 파일 대기 시간 (초)
+DOWNLOAD_WATCH_POLLING = os.environ.get("DOWNLOAD_WATCH_POLLING") == "1"  # 파일 이벤트가 불안정한 환경용
+PARTIAL_SUFFIXES = (".crdownload", ".tmp")  # 다운로드 중인 임시 파일 확장자
+
+# 화면 요소 위치 (CSS/링크 텍스트 우선, 그 외 텍스트 매칭이 필요한 경우만 XPath)
+LOGIN_LINK_LOCATOR = (By.LINK_TEXT, "로그인")
+LOGIN_BUTTON_LOCATOR = (By.XPATH, "//button[contains(text(), '로그인')] | //a[contains(text(), '로그인')]")  # 링크 텍스트로 못 찾을 때
+LOGOUT_BUTTON_LOCATOR = (By.XPATH, "//button[contains(text(), '로그아웃')]")
+LOGIN_ID_LOCATOR = (By.ID, "id_input_id")
+LOGIN_PW_LOCATOR = (By.ID, "pw_input_id")
+LOGIN_SUBMIT_LOCATOR = (By.ID, "login_submit_btn")
+SEARCH_INPUT_LOCATOR = (By.CSS_SELECTOR, "input[placeholder='건축물 소재지를 입력하세요.'], input.multiselect__input")
+SEARCH_SUGGESTION_LOCATOR = (By.CSS_SELECTOR, "#eleasticSearch li")
+SEARCH_BUTTON_LOCATOR = (By.CSS_SELECTOR, "div#eleasticSearch button")
+RESULT_GRID_LOCATOR = (By.CSS_SELECTOR, ".grid-row")
+UNIT_TAB_LOCATOR = (By.PARTIAL_LINK_TEXT, "전유부")
+UNIT_TAB_CONTENT_LOCATOR = (By.CSS_SELECTOR, ".tab-active .grid-row")
+
+# 검색어를 한 번에 입력하고 Vue 컴포넌트가 변경을 인식하도록 이벤트 발생
+SET_INPUT_VALUE_SCRIPT = (
+    "arguments[0].value = arguments[1];"
+    "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+    "arguments[0].dispatchEvent(new Event('change', {bubbles: true}));"
+)
 
 # Google Drive 설정
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
+UPLOAD_CHUNK_SIZE = 5 * 1024 * 1024  # 이 크기 이상은 청크 단위 재개 가능 업로드
+DRIVE_UPLOAD_WORKERS = int(os.environ.get("DRIVE_UPLOAD_WORKERS", "2"))  # 동시 업로드 수
+
+upload_executor = ThreadPoolExecutor(max_workers=DRIVE_UPLOAD_WORKERS)
+_chromedriver_lock = threading.Lock()  # 여러 브라우저가 동시에 드라이버를 설치하지 않도록 보호
+_drive_local = threading.local()  # 업로드 스레드별 Drive 서비스 캐시
 
 def log(msg):
     """타임스탬프와 함께 로그 출력"""
     now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     print(f"[{now}] {msg}")
 
-def upload_to_drive(file_path, folder_id, credentials_json):
+def resolve_chromedriver(refresh=False):
+    """캐시된 ChromeDriver 경로 반환. 캐시가 없거나 refresh=True면 새로 설치 후 경로 저장"""
+    with _chromedriver_lock:
+        if not refresh and os.path.exists(CHROMEDRIVER_CACHE_FILE):
+            with open(CHROMEDRIVER_CACHE_FILE, "r", encoding="utf-8") as f:
+                driver_path = f.read().strip()
+            if driver_path and os.path.exists(driver_path):
+                return driver_path
+
+        driver_path = ChromeDriverManager().install()
+        os.makedirs(os.path.dirname(CHROMEDRIVER_CACHE_FILE), exist_ok=True)
+        with open(CHROMEDRIVER_CACHE_FILE, "w", encoding="utf-8") as f:
+            f.write(driver_path)
+        return driver_path
+
+def create_driver(download_dir, is_github_actions, profile_dir=None):
+    """지정한 다운로드 폴더(와 프로필 폴더)를 사용하는 Chrome 드라이버 생성"""
+    options = webdriver.ChromeOptions()
+    
+    if is_github_actions:
+        options.add_argument("--headless")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+    else:
+        options.add_experimental_option("detach", True) 
+
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+
+    options.add_argument("--window-size=1920,1080")
+    # DOMContentLoaded 시점에 제어 반환 (이후 요소는 명시적 대기로 확인)
+    options.page_load_strategy = 'eager'
+    # 스크래핑에 불필요한 이미지 로딩 및 백그라운드 작업 비활성화 (CSS는 요소 표시 판정에 필요하므로 유지)
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-sync")
+
+    prefs = {
+        "download.default_directory": download_dir,
+        "download.prompt_for_download": False,
+        "plugins.always_open_pdf_externally": True,
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2
+    }
+    options.add_experimental_option("prefs", prefs)
+
+    # GitHub Actions 러너에는 설치된 Chrome에 맞는 chromedriver가 PATH에 포함되어 있음
+    driver_path = shutil.which("chromedriver") if is_github_actions else None
+    try:
+        driver = webdriver.Chrome(service=Service(driver_path or resolve_chromedriver()), options=options)
+    except SessionNotCreatedException:
+        # Chrome 업데이트 등으로 드라이버 버전이 맞지 않는 경우 재설치
+        log("[알림] ChromeDriver가 Chrome 버전과 맞지 않아 다시 설치합니다.")
+        driver = webdriver.Chrome(service=Service(resolve_chromedriver(refresh=True)), options=options)
+    try:
+        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        # 헤드리스 모드에서도 다운로드가 차단되지 않고 지정 폴더로 저장되도록 CDP로 명시
+        driver.execute_cdp_cmd("Browser.setDownloadBehavior", {"behavior": "allow", "downloadPath": download_dir})
+    except Exception:
+        # 설정 실패 시 이미 실행된 브라우저를 정리한 뒤 호출자에게 오류 전달
+        driver.quit()
+        raise
+    return driver
+
+def load_processed_addrs(path):
+    """처리 완료 주소 목록 로드. 파일 전체를 문자열로 읽지 않고 mmap으로 한 줄씩 읽음"""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return set()  # 빈 파일은 mmap 불가
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        processed_addrs = {line.rstrip(b"\r\n").decode("utf-8") for line in iter(mm.readline, b"")}
+    processed_addrs.discard("")
+    return processed_addrs
+
+class ProgressRecorder:
+    """처리 완료 주소를 processed.txt에 기록 (여러 브라우저 스레드에서 공유)"""
+
+    def __init__(self, path):
+        # 파일은 한 번만 열고 줄 단위 버퍼링으로 즉시 기록
+        self.fp = open(path, "a", encoding="utf-8", buffering=1)
+        self.lock = threading.Lock()
+        self.count = 0
+
+    def record(self, addr):
+        with self.lock:
+            self.fp.write(addr + "\n")
+            self.count += 1
+
+    def close(self):
+        self.fp.close()
+
+def save_error_screenshot(driver, name):
+    """오류 스크린샷을 시간 제한 내에서 저장 (드라이버가 응답하지 않아도 멈추지 않음)"""
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = os.path.join(BASE_DIR, f"{name}_{timestamp}.png")
+
+    result = {}
+
+    def capture():
+        try:
+            previous_timeouts = driver.timeouts
+            driver.set_script_timeout(SCREENSHOT_TIMEOUT)
+            driver.set_page_load_timeout(SCREENSHOT_TIMEOUT)
+            try:
+                result["png"] = driver.get_screenshot_as_png()
+            finally:
+                # 실행 중인 세션의 타임아웃 설정 복원
+                driver.timeouts = previous_timeouts
+        except Exception as e:
+            result["error"] = e
+
+    # 데몬 스레드에서 실행하여 멈춘 드라이버가 호출자도, 프로세스 종료도 붙잡지 않도록 함
+    thread = threading.Thread(target=capture, daemon=True)
+    thread.start()
+    thread.join(SCREENSHOT_TIMEOUT)
+    if thread.is_alive():
+        log(f"[주의] 오류 스크린샷 저장 실패: {SCREENSHOT_TIMEOUT}초 내에 드라이버 응답 없음")
+        return
+    if "error" in result:
+        log(f"[주의] 오류 스크린샷 저장 실패: {result['error']!r}")
+        return
+    with open(path, "wb") as f:
+        f.write(result["png"])
+    log(f"오류 스크린샷 저장: {path}")
+
+def wait_quietly(wait, condition):
+    """조건이 충족될 때까지 대기. 시간 초과 시 예외 대신 False 반환"""
+    try:
+        wait.until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+def element_replaced(locator, old_element):
+    """이전 요소가 DOM에서 사라지고 같은 위치 조건의 새 요소가 나타났는지 확인하는 대기 조건"""
+    def condition(driver):
+        if old_element is not None and not EC.staleness_of(old_element)(driver):
+            return False
+        return EC.presence_of_element_located(locator)(driver)
+    return condition
+
+def find_first(driver, locator):
+    """조건에 맞는 첫 요소 반환 (없으면 None)"""
+    elements = driver.find_elements(*locator)
+    return elements[0] if elements else None
+
+class DownloadEventHandler(FileSystemEventHandler):
+    """다운로드가 완료된 파일 경로를 큐에 전달 (임시 파일 제외)"""
+
+    def __init__(self, file_queue):
+        super().__init__()
+        self.file_queue = file_queue
+
+    def _push(self, path):
+        if not path.endswith(PARTIAL_SUFFIXES):
+            self.file_queue.put(path)
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._push(event.src_path)
+
+    def on_moved(self, event):
+        # Chrome은 다운로드 완료 시 .crdownload 임시 파일의 이름을 변경함
+        if not event.is_directory:
+            self._push(event.dest_path)
+
+def start_download_watcher(download_dir, file_queue):
+    """다운로드 폴더 감시 시작. 파일 이벤트를 쓸 수 없으면 폴링 방식으로 전환"""
+    handler = DownloadEventHandler(file_queue)
+    if not DOWNLOAD_WATCH_POLLING:
+        observer = Observer()
+        observer.schedule(handler, download_dir)
+        try:
+            observer.start()
+            return observer
+        except OSError as e:
+            log(f"[주의] 파일 이벤트 감시 실패, 폴링 방식으로 전환: {e}")
+    observer = PollingObserver(timeout=DOWNLOAD_POLL_INTERVAL)
+    observer.schedule(handler, download_dir)
+    observer.start()
+    return observer
+
+def collect_queued_files(file_queue):
+    """큐에 쌓여 있는 다운로드 이벤트를 모두 꺼내 파일명 목록으로 반환"""
+    filenames = set()
+    while True:
+        try:
+            filenames.add(os.path.basename(file_queue.get_nowait()))
+        except queue.Empty:
+            return filenames
+
+def wait_until_settled(download_dir, filenames, timeout=DOWNLOAD_TIMEOUT):
+    """대상 파일의 임시 다운로드 파일이 없고 파일 크기가 더 이상 변하지 않을 때까지 대기
+    (실패한 다운로드가 남긴 오래된 임시 파일은 무시)"""
+    started = time.time()
+    partial_names = {f + suffix for f in filenames for suffix in PARTIAL_SUFFIXES}
+
+    def is_active_partial(name):
+        # 대상 파일의 임시 파일이거나, 대기 시작 이후 기록 중인 임시 파일만 진행 중으로 판단
+        if not name.endswith(PARTIAL_SUFFIXES):
+            return False
+        if name in partial_names:
+            return True
+        try:
+            return os.path.getmtime(os.path.join(download_dir, name)) >= started
+        except OSError:
+            return False
+
+    deadline = time.monotonic() + timeout
+    last_sizes = None
+    while time.monotonic() < deadline:
+        if any(is_active_partial(f) for f in os.listdir(download_dir)):
+            last_sizes = None
+        else:
+            sizes = {}
+            for filename in filenames:
+                path = os.path.join(download_dir, filename)
+                if os.path.exists(path):
+                    sizes[filename] = os.path.getsize(path)
+            if sizes == last_sizes:
+                return True
+            last_sizes = sizes
+        time.sleep(DOWNLOAD_POLL_INTERVAL)
+    return False
+
+def wait_for_new_file(file_queue, download_dir, pending=(), timeout=DOWNLOAD_TIMEOUT):
+    """첫 다운로드 이벤트를 기다린 뒤 이어지는 파일까지 모아, 쓰기가 끝난 파일명 목록 반환
+    (pending: 이전 확인 이후 늦게 도착한 파일명, 결과에 함께 포함)"""
+    new_files = set(pending)
+    try:
+        new_files.add(os.path.basename(file_queue.get(timeout=timeout)))
+    except queue.Empty:
+        if not new_files:
+            return set()
+    while True:
+        try:
+            new_files.add(os.path.basename(file_queue.get(timeout=DOWNLOAD_SETTLE_TIME)))
+        except queue.Empty:
+            break
+
+    # 생성 이벤트는 쓰기 완료 전에도 발생하므로 다운로드가 끝났는지 확인
+    if not wait_until_settled(download_dir, new_files):
+        log(f"[주의] 다운로드가 아직 진행 중입니다: {new_files}")
+        # 완료되지 않은 파일은 큐에 되돌려 다음 확인 때 다시 처리
+        for filename in new_files:
+            file_queue.put(os.path.join(download_dir, filename))
+        return set()
+    return {f for f in new_files if os.path.exists(os.path.join(download_dir, f))}
+
+def load_drive_credentials(credentials_json):
+    """서비스 계정 JSON으로 Google Drive 인증 정보 생성"""
+    creds_dict = json.loads(credentials_json)
+    return Credentials.from_service_account_info(creds_dict, scopes=SCOPES)
+
+def get_drive_service(creds):
+    """스레드별로 한 번만 Drive 서비스 생성 (httplib2는 스레드 간 공유 불가)"""
+    service = getattr(_drive_local, "service", None)
+    if service is None:
+        # 패키지에 포함된 discovery 문서를 사용하여 네트워크 조회 생략
+        service = build('drive', 'v3', credentials=creds, cache_discovery=False, static_discovery=True)
+        _drive_local.service = service
+    return service
+
+def upload_to_drive(file_path, folder_id, creds):
     """Google Drive로 파일 업로드"""
     try:
-        creds_dict = json.loads(credentials_json)
-        creds = Credentials.from_service_account_info(creds_dict, scopes=SCOPES)
-        service = build('drive', 'v3', credentials=creds)
+        service = get_drive_service(creds)
 
         file_metadata = {
             'name': os.path.basename(file_path),
             'parents': [folder_id]
         }
-        media = MediaFileUpload(file_path, resumable=True)
-        
-        file = service.files().create(body=file_metadata, media_body=media, fields='id').execute()
+        mimetype = mimetypes.guess_type(file_path)[0] or 'application/pdf'
+        # 작은 파일은 단일 요청 업로드가 훨씬 빠름
+        resumable = os.path.getsize(file_path) >= UPLOAD_CHUNK_SIZE
+        media = MediaFileUpload(file_path, mimetype=mimetype, chunksize=UPLOAD_CHUNK_SIZE, resumable=resumable)
+
+        request = service.files().create(body=file_metadata, media_body=media, fields='id')
+        if resumable:
+            file = None
+            while file is None:
+                status, file = request.next_chunk()
+        else:
+            file = request.execute()
         log(f"[Drive] 업로드 성공: {os.path.basename(file_path)} (ID: {file.get('id')})")
         return True
     except Exception as e:
@@ -74,6 +402,12 @@ def main():
     # 구글 드라이브 관련 변수
     drive_creds_json = os.environ.get("GOOGLE_CREDENTIALS_JSON")
     drive_folder_id = os.environ.get("GOOGLE_DRIVE_FOLDER_ID")
+    drive_creds = None
+    if drive_creds_json and drive_folder_id:
+        try:
+            drive_creds = load_drive_credentials(drive_creds_json)
+        except Exception as e:
+            log(f"[Drive] 인증 정보 로드 실패: {e}")
     
     is_github_actions = os.environ.get("GITHUB_ACTIONS") == "true"
     
@@ -88,138 +422,199 @@ def main():
         return
 
     # 2. 처리된 목록 로드
-    processed_addrs = set()
-    if os.path.exists(PROCESSED_LOG_FILE):
-        with open(PROCESSED_LOG_FILE, "r", encoding="utf-8") as f:
-            processed_addrs = set(line.strip() for line in f if line.strip())
+    processed_addrs = load_processed_addrs(PROCESSED_LOG_FILE)
     log(f"이미 처리된 주소: {len(processed_addrs)}개")
 
     # 3. 엑셀 로드 및 대상 선정
     try:
-        df = pd.read_excel(EXCEL_PATH)
+        # '주소' 컬럼만 읽음 (컬럼이 없으면 빈 DataFrame 반환)
+        df = pd.read_excel(EXCEL_PATH, usecols=lambda col: col == '주소', engine='openpyxl', dtype=str)
         if '주소' not in df.columns:
             log("[오류] 엑셀 파일에 '주소' 컬럼이 없습니다.")
             return
         
-        all_addresses = df['주소'].dropna().unique().tolist()
-        target_addresses = [addr for addr in all_addresses if addr not in processed_addrs]
+        # 처리된 주소 제외는 pandas 해시 연산으로 수행 (원래 순서 유지)
+        all_addresses = pd.Index(df['주소'].dropna().unique())
+        target_addresses = all_addresses.difference(pd.Index(list(processed_addrs)), sort=False)
         
         log(f"전체 주소: {len(all_addresses)}개, 남은 주소: {len(target_addresses)}개")
         
-        if not target_addresses:
+        if target_addresses.empty:
             log("[완료] 모든 주소가 처리되었습니다.")
             return
 
-        current_chunk = target_addresses[:CHUNK_SIZE]
+        current_chunk = target_addresses[:CHUNK_SIZE].tolist()
         log(f"이번 실행 처리 대상: {len(current_chunk)}개")
 
     except Exception as e:
         log(f"[오류] 엑셀 파일을 읽는 중 문제가 발생했습니다: {e}")
         return
 
-    # 4. 브라우저 설정
-    log("브라우저 설정 중...")
-    options = webdriver.ChromeOptions()
-    
-    if is_github_actions:
-        options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-    else:
-        options.add_experimental_option("detach", True) 
+    # 4. 브라우저 수 결정 및 주소 분배
+    worker_count = max(1, min(SCRAPER_WORKERS, len(current_chunk)))
+    if worker_count > 1 and not (user_id and user_pw):
+        log("[알림] 수동 로그인이 필요하므로 브라우저 1개로 실행합니다.")
+        worker_count = 1
+    log(f"동시 실행 브라우저: {worker_count}개")
 
-    options.add_argument("--window-size=1920,1080")
-    
     if not os.path.exists(DOWNLOAD_DIR):
         os.makedirs(DOWNLOAD_DIR)
 
-    prefs = {
-        "download.default_directory": DOWNLOAD_DIR,
-        "download.prompt_for_download": False,
-        "plugins.always_open_pdf_externally": True
-    }
-    options.add_experimental_option("prefs", prefs)
+    addr_queue = queue.Queue()
+    for index, addr in enumerate(current_chunk, 1):
+        addr_queue.put((index, addr))
 
-    try:
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-        wait = WebDriverWait(driver, 20)
-    except Exception as e:
-        log(f"[치명적 오류] 브라우저 실행 실패: {e}")
-        return
+    recorder = ProgressRecorder(PROCESSED_LOG_FILE)
+    upload_futures = []
 
-    try:
-        # 5. 세움터 접속 및 로그인
-        log(f"사이트 접속 시도: {TARGET_URL}")
-        driver.get(TARGET_URL)
-        log("사이트 접속 완료")
-        
-        if user_id and user_pw:
-            perform_login(driver, wait, user_id, user_pw)
-        else:
-            if is_github_actions:
-                log("[주의] GitHub Actions 환경인데 로그인 정보가 없습니다.")
-            else:
-                log("[알림] 로컬 실행 중입니다. 수동으로 로그인해주세요.")
-                log("로그인이 완료되고 주소 검색 준비가 되면 엔터키를 눌러주세요.")
-                input(">>> 엔터키를 누르면 진행합니다...")
+    def scrape_worker(worker_id):
+        """브라우저 1개로 주소 큐가 빌 때까지 처리"""
+        prefix = f"[브라우저 {worker_id}] " if worker_count > 1 else ""
+        # 브라우저마다 다운로드 폴더를 분리하여 파일이 섞이지 않도록 함
+        download_dir = DOWNLOAD_DIR if worker_count == 1 else os.path.join(DOWNLOAD_DIR, f"worker-{worker_id}")
+        os.makedirs(download_dir, exist_ok=True)
 
-        # 6. 주소 반복 처리
-        processed_count = 0
-        
-        for addr in current_chunk:
-            log(f"--- [진행률 {processed_count+1}/{len(current_chunk)}] 주소 처리 시작: {addr} ---")
-            
-            # 다운로드 전 파일 목록 확인
-            before_files = set(os.listdir(DOWNLOAD_DIR))
-            
-            success = process_address(driver, wait, addr)
+        # CI에서는 프로필 폴더를 캐시하여 쿠키(로그인 세션)를 다음 실행에서 재사용
+        # (로컬은 브라우저를 닫지 않으므로 프로필 잠금 충돌을 피하기 위해 사용하지 않음)
+        profile_dir = os.path.join(CHROME_PROFILE_DIR, f"worker-{worker_id}") if is_github_actions else None
+
+        log(f"{prefix}브라우저 설정 중...")
+        try:
+            driver = create_driver(download_dir, is_github_actions, profile_dir)
+            wait = WebDriverWait(driver, WAIT_TIMEOUT)
+        except Exception as e:
+            log(f"{prefix}[치명적 오류] 브라우저 실행 실패: {e}")
+            return
+
+        def upload_files(filenames):
+            """구글 드라이브 업로드 (백그라운드 진행, 다음 주소 처리를 기다리게 하지 않음)"""
+            if not drive_creds:
+                log("[Drive] 구글 드라이브 설정이 없어 업로드를 건너뜁니다.")
+                return
+            for filename in filenames:
+                file_path = os.path.join(download_dir, filename)
+                upload_futures.append(
+                    upload_executor.submit(upload_to_drive, file_path, drive_folder_id, drive_creds))
+
+        download_queue = queue.Queue()
+        observer = None
+
+        try:
+            observer = start_download_watcher(download_dir, download_queue)
+
+            # 5. 세움터 접속 및 로그인
+            log(f"{prefix}사이트 접속 시도: {TARGET_URL}")
+            driver.get(TARGET_URL)
+            log(f"{prefix}사이트 접속 완료")
             
-            if success:
-                # 다운로드 확인 및 업로드
-                time.sleep(5) # 다운로드 대기
-                after_files = set(os.listdir(DOWNLOAD_DIR))
-                new_files = after_files - before_files
+            # 저장된 프로필을 쓸 때만 기존 로그인 세션 확인 (그 외에는 대기 시간만 추가됨)
+            if profile_dir and is_logged_in(driver):
+                log(f"{prefix}저장된 세션으로 로그인되어 있어 로그인을 건너뜁니다.")
+            elif user_id and user_pw:
+                perform_login(driver, wait, user_id, user_pw)
+            else:
+                if is_github_actions:
+                    log("[주의] GitHub Actions 환경인데 로그인 정보가 없습니다.")
+                else:
+                    log("[알림] 로컬 실행 중입니다. 수동으로 로그인해주세요.")
+                    log("로그인이 완료되고 주소 검색 준비가 되면 엔터키를 눌러주세요.")
+                    input(">>> 엔터키를 누르면 진행합니다...")
+
+            # 6. 주소 반복 처리
+            consecutive_failures = 0
+            pending_files = set()  # 이전 주소의 대기 시간이 지난 뒤 완료된 다운로드
+            while True:
+                try:
+                    index, addr = addr_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                log(f"{prefix}--- [진행률 {index}/{len(current_chunk)}] 주소 처리 시작: {addr} ---")
+                
+                # 이전 주소에서 늦게 완료된 다운로드는 버리지 않고 이번 결과에 포함
+                pending_files |= collect_queued_files(download_queue)
+                
+                started = time.monotonic()
+                success, download_started = process_address(driver, wait, addr)
                 
-                if new_files:
-                    log(f"다운로드된 파일: {new_files}")
-                    # 구글 드라이브 업로드
-                    if drive_creds_json and drive_folder_id:
-                        for filename in new_files:
-                            file_path = os.path.join(DOWNLOAD_DIR, filename)
-                            upload_to_drive(file_path, drive_folder_id, drive_creds_json)
+                if success:
+                    # 다운로드 확인 및 업로드
+                    # 다운로드를 시작하지 않았으면 새 파일을 기다리지 않고 늦게 도착한 파일만 확인
+                    timeout = DOWNLOAD_TIMEOUT if download_started else 0
+                    new_files = wait_for_new_file(download_queue, download_dir, pending_files, timeout=timeout)
+                    pending_files = set()
+                    
+                    if new_files:
+                        log(f"{prefix}다운로드된 파일: {new_files}")
+                        upload_files(new_files)
                     else:
-                        log("[Drive] 구글 드라이브 설정이 없어 업로드를 건너뜁니다.")
+                        log(f"{prefix}[주의] 다운로드된 파일이 감지되지 않았습니다.")
+
+                    recorder.record(addr)
+                    log(f"{prefix}처리 완료 기록됨: {addr}")
+                
+                # 서버 부하 방지: 처리가 빨랐을 때만 최소 간격을 채우고, 연속 실패 시 지수 백오프
+                if success:
+                    consecutive_failures = 0
+                    time.sleep(max(0, MIN_ADDRESS_INTERVAL - (time.monotonic() - started)))
                 else:
-                    log("[주의] 다운로드된 파일이 감지되지 않았습니다.")
+                    consecutive_failures += 1
+                    delay = min(FAILURE_BACKOFF_MAX, FAILURE_BACKOFF_BASE * 2 ** (consecutive_failures - 1))
+                    log(f"{prefix}[주의] 연속 실패 {consecutive_failures}회, {delay}초 이상 대기합니다.")
+                    time.sleep(delay + random.uniform(0, delay / 2))
 
-                with open(PROCESSED_LOG_FILE, "a", encoding="utf-8") as f:
-                    f.write(addr + "\n")
-                processed_count += 1
-                log(f"처리 완료 기록됨: {addr}")
-            
-            time.sleep(2)
+            # 마지막 주소 이후 늦게 완료된 다운로드 업로드
+            pending_files |= collect_queued_files(download_queue)
+            if pending_files:
+                late_files = wait_for_new_file(download_queue, download_dir, pending_files, timeout=0)
+                if late_files:
+                    log(f"{prefix}늦게 완료된 다운로드 파일: {late_files}")
+                    upload_files(late_files)
 
-    except Exception as e:
-        log(f"[치명적 오류] 실행 중 예외 발생: {e}")
-        if is_github_actions:
-            driver.save_screenshot(os.path.join(BASE_DIR, "error_screenshot.png"))
+        except Exception as e:
+            log(f"{prefix}[치명적 오류] 실행 중 예외 발생: {e}")
+            if is_github_actions:
+                save_error_screenshot(driver, f"error_screenshot_{worker_id}")
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+            if is_github_actions:
+                driver.quit()
+            else:
+                log("로컬 실행이므로 브라우저를 닫지 않습니다.")
+
+    workers = [threading.Thread(target=scrape_worker, args=(worker_id,)) for worker_id in range(1, worker_count + 1)]
+    try:
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
     finally:
-        log(f"작업 종료. 총 {processed_count}개 처리 완료.")
-        if is_github_actions:
-            driver.quit()
-        else:
-            log("로컬 실행이므로 브라우저를 닫지 않습니다.")
+        recorder.close()
+        if upload_futures:
+            log(f"[Drive] 남은 업로드 완료 대기 중... ({len(upload_futures)}개)")
+            wait_futures(upload_futures)
+        log(f"작업 종료. 총 {recorder.count}개 처리 완료.")
+
+def is_logged_in(driver):
+    """로그아웃 버튼 존재 여부로 이미 로그인된 상태인지 확인"""
+    short_wait = WebDriverWait(driver, SHORT_WAIT_TIMEOUT, poll_frequency=POLL_FREQUENCY)
+    return wait_quietly(short_wait, EC.presence_of_element_located(LOGOUT_BUTTON_LOCATOR))
 
 def perform_login(driver, wait, user_id, user_pw):
     log("자동 로그인 시도 중...")
     try:
         log("로그인 버튼 찾는 중...")
-        login_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), '로그인')] | //a[contains(text(), '로그인')]")))
+        login_btn = wait.until(EC.any_of(
+            EC.element_to_be_clickable(LOGIN_LINK_LOCATOR),
+            EC.element_to_be_clickable(LOGIN_BUTTON_LOCATOR)
+        ))
         login_btn.click()
         
         log("아이디/비번 입력 중...")
-        id_input = wait.until(EC.presence_of_element_located((By.ID, "id_input_id"))) 
-        pw_input = driver.find_element(By.ID, "pw_input_id")
+        id_input = wait.until(EC.presence_of_element_located(LOGIN_ID_LOCATOR)) 
+        pw_input = driver.find_element(*LOGIN_PW_LOCATOR)
         
         id_input.clear()
         id_input.send_keys(user_id)
@@ -227,44 +622,51 @@ def perform_login(driver, wait, user_id, user_pw):
         pw_input.send_keys(user_pw)
         
         log("로그인 제출 버튼 클릭...")
-        submit_btn = driver.find_element(By.ID, "login_submit_btn")
+        submit_btn = driver.find_element(*LOGIN_SUBMIT_LOCATOR)
         submit_btn.click()
         
-        wait.until(EC.presence_of_element_located((By.XPATH, "//button[contains(text(), '로그아웃')]")))
+        wait.until(EC.presence_of_element_located(LOGOUT_BUTTON_LOCATOR))
         log("로그인 성공!")
         
     except Exception as e:
         log(f"[오류] 로그인 실패: {e}")
-        driver.save_screenshot("login_failed.png")
+        save_error_screenshot(driver, "login_failed")
         raise e
 
 def process_address(driver, wait, addr):
+    """주소 검색 후 (성공 여부, 다운로드 시작 여부) 반환"""
+    suggestion_wait = WebDriverWait(driver, SUGGESTION_WAIT_TIMEOUT, poll_frequency=POLL_FREQUENCY)
+    result_wait = WebDriverWait(driver, RESULT_WAIT_TIMEOUT, poll_frequency=POLL_FREQUENCY)
+    tab_content_wait = WebDriverWait(driver, TAB_CONTENT_WAIT_TIMEOUT, poll_frequency=POLL_FREQUENCY)
     try:
         log(f"검색어 입력: {addr}")
         try:
-            search_input = wait.until(EC.presence_of_element_located((By.XPATH, "//input[@placeholder='건축물 소재지를 입력하세요.'] | //input[contains(@class, 'multiselect__input')]")))
+            search_input = wait.until(EC.presence_of_element_located(SEARCH_INPUT_LOCATOR))
         except TimeoutException:
             log("[오류] 검색창을 찾을 수 없습니다.")
-            return False
+            return False, False
 
-        search_input.send_keys(Keys.CONTROL + "a")
-        search_input.send_keys(Keys.DELETE)
-        time.sleep(0.5)
-        search_input.send_keys(addr)
-        time.sleep(1)
+        # 단일 페이지 앱이라 이전 주소의 결과가 DOM에 남아 있으므로 교체 여부 판단용으로 보관
+        old_grid = find_first(driver, RESULT_GRID_LOCATOR)
+
+        driver.execute_script(SET_INPUT_VALUE_SCRIPT, search_input, addr)
+        # 자동완성 목록 표시 대기
+        wait_quietly(suggestion_wait, EC.visibility_of_element_located(SEARCH_SUGGESTION_LOCATOR))
         search_input.send_keys(Keys.ENTER)
         
         try:
-            driver.find_element(By.XPATH, "//div[@id='eleasticSearch']//button").click()
+            driver.find_element(*SEARCH_BUTTON_LOCATOR).click()
         except:
             pass
 
-        time.sleep(3)
+        # 이전 결과가 사라지고 새 검색 결과 그리드가 표시될 때까지 대기
+        wait_quietly(result_wait, element_replaced(RESULT_GRID_LOCATOR, old_grid))
 
         try:
-            tab = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), '전유부')]")))
+            tab = wait.until(EC.element_to_be_clickable(UNIT_TAB_LOCATOR))
+            old_tab_content = find_first(driver, UNIT_TAB_CONTENT_LOCATOR)
             tab.click()
-            time.sleep(2)
+            wait_quietly(tab_content_wait, element_replaced(UNIT_TAB_CONTENT_LOCATOR, old_tab_content))
         except:
             log("'전유부' 탭이 없거나 이미 선택됨.")
 
@@ -273,12 +675,13 @@ def process_address(driver, wait, addr):
         # 테스트를 위해 가짜 파일 생성 (실제 구현 시 삭제)
         # fake_file = os.path.join(DOWNLOAD_DIR, f"{addr}.pdf")
         # with open(fake_file, "w") as f: f.write("test")
+        download_started = False  # 다운로드 버튼 클릭 구현 시 True로 설정
         
-        return True
+        return True, download_started
 
     except Exception as e:
         log(f"[오류] {addr} 처리 중 예외: {e}")
-        return False
+        return False, False
 
 if __name__ == "__main__":
     main()